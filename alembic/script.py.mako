@@ -11,6 +11,9 @@ from alembic import op
 import sqlalchemy as sa
 ${imports if imports else ""}
 
+# 데이터 마이그레이션은 app.db.migration_utils를 사용할 것:
+# paginated()로 페이지 단위 조회(테이블 전체 로드 금지), autocommit_block() 안에서 페이지마다 커밋
+
 # revision identifiers, used by Alembic.
 revision: str = ${repr(up_revision)}
 down_revision: Union[str, None] = ${repr(down_revision)}
@@ -8,7 +8,6 @@ Create Date: 2025-03-20 11:20:21.880684
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
 
 
 # revision identifiers, used by Alembic.
@@ -20,15 +19,18 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.add_column('attachments', sa.Column('course_id', sa.String(), nullable=False))
-    op.drop_column('attachments', 'user_id')
-    # ### end Alembic commands ###
+    # 컬럼 추가/삭제를 하나의 ALTER TABLE 문으로 실행 (테이블 잠금 한 번)
+    op.execute(
+        "ALTER TABLE attachments "
+        "ADD COLUMN course_id VARCHAR NOT NULL, "
+        "DROP COLUMN user_id"
+    )
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.add_column('attachments', sa.Column('user_id', sa.VARCHAR(), autoincrement=False, nullable=False))
-    op.drop_column('attachments', 'course_id')
-    # ### end Alembic commands ###
+    op.execute(
+        "ALTER TABLE attachments "
+        "ADD COLUMN user_id VARCHAR NOT NULL, "
+        "DROP COLUMN course_id"
+    )
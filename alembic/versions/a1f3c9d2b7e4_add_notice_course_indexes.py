@@ -0,0 +1,30 @@
+"""add notice course indexes
+
+Revision ID: a1f3c9d2b7e4
+Revises: 7c567d9373f8
+Create Date: 2025-03-24 10:12:37.412905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1f3c9d2b7e4'
+down_revision: Union[str, None] = '7c567d9373f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_notices_course_date', 'notices', ['course_id', sa.text('date DESC')])
+    op.create_index('ix_notices_course_article', 'notices', ['course_id', 'article_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notices_course_article', table_name='notices')
+    op.drop_index('ix_notices_course_date', table_name='notices')
@@ -0,0 +1,43 @@
+"""change notice date to timestamptz
+
+Revision ID: d5b81e6f3a92
+Revises: a1f3c9d2b7e4
+Create Date: 2025-03-24 14:03:51.227164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b81e6f3a92'
+down_revision: Union[str, None] = 'a1f3c9d2b7e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 값은 'YYYY-MM-DD' 또는 'YYYY.MM.DD' 형식의 KST 날짜 문자열
+    with op.batch_alter_table('notices') as batch_op:
+        batch_op.alter_column(
+            'date',
+            existing_type=sa.String(),
+            type_=sa.DateTime(timezone=True),
+            existing_nullable=True,
+            postgresql_using="NULLIF(replace(date, '.', '-'), '')::timestamp AT TIME ZONE 'Asia/Seoul'"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('notices') as batch_op:
+        batch_op.alter_column(
+            'date',
+            existing_type=sa.DateTime(timezone=True),
+            type_=sa.String(),
+            existing_nullable=True,
+            postgresql_using="to_char(date AT TIME ZONE 'Asia/Seoul', 'YYYY-MM-DD')"
+        )
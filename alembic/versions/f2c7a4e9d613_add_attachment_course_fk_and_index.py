@@ -0,0 +1,31 @@
+"""add attachment course fk and index
+
+Revision ID: f2c7a4e9d613
+Revises: d5b81e6f3a92
+Create Date: 2025-03-25 09:41:06.583120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c7a4e9d613'
+down_revision: Union[str, None] = 'd5b81e6f3a92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('attachments') as batch_op:
+        batch_op.create_foreign_key('fk_attachments_course', 'courses', ['course_id'], ['id'])
+        batch_op.create_index('ix_attachments_course_id', ['course_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('attachments') as batch_op:
+        batch_op.drop_index('ix_attachments_course_id')
+        batch_op.drop_constraint('fk_attachments_course', type_='foreignkey')
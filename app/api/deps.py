@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Generator, Optional, Any, AsyncGenerator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -39,7 +40,6 @@ _eclass_session_manager = None
 _storage_service = None
 _course_service = None
 _notice_service = None
-_auth_service = None
 _material_service = None
 _assignment_service = None
 _syllabus_service = None
@@ -60,52 +60,64 @@ def get_eclass_session_manager() -> EclassSessionManager:
         _eclass_session_manager = EclassSessionManager()
     return _eclass_session_manager
 
+@lru_cache()
 def get_auth_service() -> AuthService:
-    """인증 서비스 제공"""
+    """인증 서비스 제공 (싱글톤)"""
     return AuthService(get_supabase_client())
 
-# 파서 의존성
+# 파서 의존성 (상태가 없으므로 앱 전체에서 하나의 인스턴스를 공유)
+@lru_cache()
 def get_course_parser() -> CourseParser:
     """CourseParser 제공"""
     return CourseParser()
 
+@lru_cache()
 def get_notice_parser() -> NoticeParser:
     """NoticeParser 제공"""
     return NoticeParser()
 
+@lru_cache()
 def get_material_parser() -> MaterialParser:
     """MaterialParser 제공"""
     return MaterialParser()
 
+@lru_cache()
 def get_assignment_parser() -> AssignmentParser:
     """AssignmentParser 제공"""
     return AssignmentParser()
 
+@lru_cache()
 def get_syllabus_parser() -> SyllabusParser:
     """SyllabusParser 제공"""
     return SyllabusParser()
 
-# 리포지토리 의존성
+# 리포지토리 의존성 (상태가 없으므로 앱 전체에서 하나의 인스턴스를 공유)
+@lru_cache()
 def get_course_repository() -> CourseRepository:
     """CourseRepository 제공"""
     return CourseRepository()
 
+@lru_cache()
 def get_notice_repository() -> NoticeRepository:
     """NoticeRepository 제공"""
     return NoticeRepository()
 
+@lru_cache()
 def get_material_repository() -> MaterialRepository:
     """MaterialRepository 제공"""
     return MaterialRepository()
 
+@lru_cache()
 def get_assignment_repository() -> AssignmentRepository:
     """AssignmentRepository 제공"""
     return AssignmentRepository()
 
+@lru_cache()
 def get_attachment_repository() -> AttachmentRepository:
     """AttachmentRepository 제공"""
     return AttachmentRepository()
 
+@lru_cache()
 def get_syllabus_repository() -> SyllabusRepository:
     """SyllabusRepository 제공"""
     return SyllabusRepository()
@@ -119,115 +131,81 @@ def get_storage_service() -> StorageService:
     return _storage_service
 
 # 콘텐츠 서비스 의존성
-def get_course_service(
-    eclass_session_manager: EclassSessionManager = Depends(get_eclass_session_manager),
-    course_parser: CourseParser = Depends(get_course_parser),
-    course_repository: CourseRepository = Depends(get_course_repository)
-) -> CourseService:
+# 하위 의존성을 직접 호출하여 요청마다 의존성 그래프를 풀지 않도록 함
+def get_course_service() -> CourseService:
     """CourseService 제공 (싱글톤)"""
     global _course_service
     if not _course_service:
         _course_service = CourseService(
-            session_service=eclass_session_manager,
-            course_parser=course_parser,
-            course_repository=course_repository
+            session_service=get_eclass_session_manager(),
+            course_parser=get_course_parser(),
+            course_repository=get_course_repository()
         )
     return _course_service
 
-def get_notice_service(
-    eclass_session_manager: EclassSessionManager = Depends(get_eclass_session_manager),
-    notice_parser: NoticeParser = Depends(get_notice_parser),
-    notice_repository: NoticeRepository = Depends(get_notice_repository),
-    attachment_repository: AttachmentRepository = Depends(get_attachment_repository),
-    storage_service: StorageService = Depends(get_storage_service)
-) -> NoticeService:
+def get_notice_service() -> NoticeService:
     """NoticeService 제공 (싱글톤)"""
     global _notice_service
     if not _notice_service:
         _notice_service = NoticeService(
-            eclass_session=eclass_session_manager,
-            notice_parser=notice_parser,
-            notice_repository=notice_repository,
-            attachment_repository=attachment_repository,
-            storage_service=storage_service
+            eclass_session=get_eclass_session_manager(),
+            notice_parser=get_notice_parser(),
+            notice_repository=get_notice_repository(),
+            attachment_repository=get_attachment_repository(),
+            storage_service=get_storage_service()
         )
     return _notice_service
 
-def get_material_service(
-    eclass_session_manager: EclassSessionManager = Depends(get_eclass_session_manager),
-    material_parser: MaterialParser = Depends(get_material_parser),
-    material_repository: MaterialRepository = Depends(get_material_repository),
-    attachment_repository: AttachmentRepository = Depends(get_attachment_repository),
-    storage_service: StorageService = Depends(get_storage_service),
-    auth_service: AuthService = Depends(get_auth_service)
-) -> MaterialService:
+def get_material_service() -> MaterialService:
     """MaterialService 제공 (싱글톤)"""
     global _material_service
     if not _material_service:
         _material_service = MaterialService(
-            eclass_session=eclass_session_manager,
-            material_parser=material_parser,
-            material_repository=material_repository,
-            attachment_repository=attachment_repository,
-            storage_service=storage_service,
-            auth_service=auth_service
+            eclass_session=get_eclass_session_manager(),
+            material_parser=get_material_parser(),
+            material_repository=get_material_repository(),
+            attachment_repository=get_attachment_repository(),
+            storage_service=get_storage_service(),
+            auth_service=get_auth_service()
         )
     return _material_service
 
-def get_assignment_service(
-    eclass_session_manager: EclassSessionManager = Depends(get_eclass_session_manager),
-    assignment_parser: AssignmentParser = Depends(get_assignment_parser),
-    assignment_repository: AssignmentRepository = Depends(get_assignment_repository),
-    attachment_repository: AttachmentRepository = Depends(get_attachment_repository),
-    storage_service: StorageService = Depends(get_storage_service)
-) -> AssignmentService:
+def get_assignment_service() -> AssignmentService:
     """AssignmentService 제공 (싱글톤)"""
     global _assignment_service
     if not _assignment_service:
         _assignment_service = AssignmentService(
-            session_service=eclass_session_manager,
-            assignment_parser=assignment_parser,
-            assignment_repository=assignment_repository,
-            attachment_repository=attachment_repository,
+            session_service=get_eclass_session_manager(),
+            assignment_parser=get_assignment_parser(),
+            assignment_repository=get_assignment_repository(),
+            attachment_repository=get_attachment_repository(),
         )
     return _assignment_service
 
-def get_syllabus_service(
-    eclass_session_manager: EclassSessionManager = Depends(get_eclass_session_manager),
-    syllabus_parser: SyllabusParser = Depends(get_syllabus_parser),
-    syllabus_repository: SyllabusRepository = Depends(get_syllabus_repository),
-    auth_service: AuthService = Depends(get_auth_service)
-) -> SyllabusService:
+def get_syllabus_service() -> SyllabusService:
     """SyllabusService 제공 (싱글톤)"""
     global _syllabus_service
     if not _syllabus_service:
         _syllabus_service = SyllabusService(
-            eclass_session=eclass_session_manager,
-            syllabus_parser=syllabus_parser,
-            syllabus_repository=syllabus_repository,
-            auth_service=auth_service
+            eclass_session=get_eclass_session_manager(),
+            syllabus_parser=get_syllabus_parser(),
+            syllabus_repository=get_syllabus_repository(),
+            auth_service=get_auth_service()
         )
     return _syllabus_service
 
 #크롤러 의존성
-def get_crawl_service(
-    eclass_session: EclassSessionManager = Depends(get_eclass_session_manager),
-    course_service: CourseService = Depends(get_course_service),
-    notice_service: NoticeService = Depends(get_notice_service),
-    material_service: MaterialService = Depends(get_material_service),
-    assignment_service: AssignmentService = Depends(get_assignment_service),
-    syllabus_service: SyllabusService = Depends(get_syllabus_service)
-) -> CrawlService:
+def get_crawl_service() -> CrawlService:
     """CrawlService 제공 (싱글톤)"""
     global _crawl_service
     if not _crawl_service:
         _crawl_service = CrawlService(
-            eclass_session=eclass_session,
-            course_service=course_service,
-            notice_service=notice_service,
-            material_service=material_service,
-            assignment_service=assignment_service,
-            syllabus_service=syllabus_service
+            eclass_session=get_eclass_session_manager(),
+            course_service=get_course_service(),
+            notice_service=get_notice_service(),
+            material_service=get_material_service(),
+            assignment_service=get_assignment_service(),
+            syllabus_service=get_syllabus_service()
         )
     return _crawl_service
 
@@ -1,21 +1,19 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
+from fastapi.security import OAuth2PasswordRequestForm
 from typing import Any
 
 from app.schemas.auth import UserCreate, Token, UserOut
 from app.services.auth_service import AuthService
 from app.services.session.auth_session_service import AuthSessionService
 from app.services.session.eclass_session_manager import EclassSessionManager
-from app.api.deps import get_auth_service, get_auth_session_service, get_eclass_session_manager, get_current_user
+from app.api.deps import get_auth_service, get_auth_session_service, get_eclass_session_manager, get_current_user, oauth2_scheme
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
-
 
 @router.post("/register", response_model=UserOut)
 async def register(
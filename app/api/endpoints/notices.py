@@ -35,8 +35,9 @@ async def get_notices(
             detail="강의를 찾을 수 없습니다."
         )
 
-    notices = await notice_service.get_all(db, course_id, skip=skip, limit=limit)
+    notices = await notice_service.get_cached_list(db, course_id)
     total = len(notices)
+    notices = notices[skip:skip + limit]
 
     return {
         "notices": notices,
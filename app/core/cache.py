@@ -0,0 +1,46 @@
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """만료 시간이 있는 프로세스 내 캐시"""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}  # key -> (만료 시각, 값)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값 반환 (없거나 만료된 경우 None)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (ttl 미지정 시 기본 ttl 사용)"""
+        if len(self._data) >= self.maxsize:
+            self._purge()
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def pop(self, key: Hashable) -> None:
+        """값 제거"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 값 제거"""
+        self._data.clear()
+
+    def _purge(self) -> None:
+        """만료된 값을 정리하고, 그래도 가득 찬 경우 가장 오래된 값 제거"""
+        now = time.monotonic()
+        for key in [key for key, (expires_at, _) in self._data.items() if expires_at <= now]:
+            del self._data[key]
+
+        while len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
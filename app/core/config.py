@@ -20,6 +20,7 @@ class Settings(BaseSettings):
     SQLALCHEMY_DATABASE_URI: Optional[str] = None
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE: int = 3600  # 커넥션 재생성 주기(초 단위)
 
     # Supabase 설정
     SUPABASE_URL: str
@@ -45,9 +46,12 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_TASKS: int = 5
     CRAWL_INTERVAL: int = 3600  # 1시간(초 단위)
     REQUEST_TIMEOUT: int = 30  # HTTP 요청 타임아웃(초 단위)
+    NOTICE_LIST_CACHE_TTL: int = 300  # 강의별 공지사항 목록 캐시 유지 시간(초 단위)
 
     # 세션 설정
     SESSION_EXPIRE_MINUTES: int = 60
+    AUTH_TOKEN_CACHE_TTL: int = 60  # 검증된 토큰 캐시 유지 시간(초 단위)
+    ECLASS_SESSION_CHECK_TTL: int = 1200  # 이클래스 로그인 상태 재검증 주기(초 단위)
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding='utf-8', case_sensitive=True)
 
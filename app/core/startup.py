@@ -3,7 +3,7 @@ import logging
 from fastapi import FastAPI
 
 from app.api.deps import (
-    get_session_service, 
+    get_eclass_session_manager, 
     get_storage_service,
     get_course_service,
     get_notice_service,
@@ -20,7 +20,7 @@ async def startup_event(app: FastAPI) -> None:
     logger.info("애플리케이션 시작 이벤트 실행")
     
     # 세션 서비스 초기화
-    session_service = get_session_service()
+    session_service = get_eclass_session_manager()
     await session_service.initialize()
     
     # 스토리지 서비스 초기화
@@ -81,14 +81,14 @@ async def shutdown_event(app: FastAPI) -> None:
     await storage_service.close()
     
     # 세션 서비스 종료 (마지막에 종료)
-    session_service = get_session_service()
+    session_service = get_eclass_session_manager()
     await session_service.close()
     
     logger.info("모든 서비스 종료 완료")
 
 async def session_check_task() -> None:
     """세션 건강 상태 주기적 확인 태스크"""
-    session_service = get_session_service()
+    session_service = get_eclass_session_manager()
     
     while True:
         try:
@@ -3,7 +3,7 @@ from functools import lru_cache
 
 from app.core.config import settings
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
     """Supabase 클라이언트 초기화 및 캐싱"""
     return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
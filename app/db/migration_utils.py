@@ -0,0 +1,46 @@
+"""Alembic 데이터 마이그레이션 유틸리티"""
+from contextlib import contextmanager
+from typing import Any, Iterator, List
+
+from alembic import op
+from sqlalchemy.engine import Connection, Row
+from sqlalchemy.sql import ColumnElement, Select
+
+
+def paginated(
+    connection: Connection,
+    query: Select,
+    key_column: ColumnElement[Any],
+    page_size: int = 100
+) -> Iterator[List[Row]]:
+    """
+    조회 결과를 key_column 기준 키셋 페이지네이션으로 page_size 단위로 나누어 반환
+
+    OFFSET 대신 직전 페이지의 마지막 키보다 큰 행만 조회하므로, 순회 중에 행을
+    수정해 조회 조건에서 빠지더라도 건너뛰는 행이 없다. key_column은 유일하고
+    정렬 가능한 컬럼(보통 기본 키)이어야 하며 query의 조회 컬럼에 포함되어야 한다.
+    query에 지정된 order_by는 key_column 정렬로 대체된다.
+    """
+    query = query.order_by(None).order_by(key_column).limit(page_size)
+    last_key = None
+    while True:
+        page_query = query if last_key is None else query.where(key_column > last_key)
+        rows = connection.execute(page_query).all()
+        if not rows:
+            break
+
+        yield rows
+
+        if len(rows) < page_size:
+            break
+        last_key = rows[-1]._mapping[key_column]
+
+
+@contextmanager
+def autocommit_block() -> Iterator[None]:
+    """
+    마이그레이션 트랜잭션 밖에서 실행
+    블록 안의 각 문장은 실행 즉시 커밋되므로 페이지 단위 커밋에 사용
+    """
+    with op.get_context().autocommit_block():
+        yield
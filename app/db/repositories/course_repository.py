@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from sqlalchemy import select, join
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -26,6 +26,19 @@ class CourseRepository(BaseRepository):
         result = await db.execute(query)
         return result.scalars().all()
 
+    async def get_by_user_and_course_id(self, db: AsyncSession, user_id: str, course_id: str) -> Optional[Course]:
+        """사용자가 수강 중인 단일 코스 조회 (user_courses 기본 키로 조회)"""
+        query = select(self.model).join(
+            user_courses,
+            self.model.id == user_courses.c.course_id
+        ).where(
+            user_courses.c.user_id == user_id,
+            user_courses.c.course_id == course_id
+        )
+
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
     async def get_by_course_id(self, db: AsyncSession, course_id: int) -> Course:
         """코스 ID로 단일 코스 조회"""
         query = select(self.model).where(self.model.id == course_id)
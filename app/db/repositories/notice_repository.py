@@ -1,6 +1,7 @@
 from typing import List, Dict, Any, Optional, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, exists
+from sqlalchemy.dialects.postgresql import insert
 from app.db.repositories.base import BaseRepository
 from app.models.notice import Notice
 
@@ -20,6 +21,20 @@ class NoticeRepository(BaseRepository[Notice]):
         result = await db.execute(query)
         return result.scalars().all()
 
+    async def get_summaries_by_course_id(self, db: AsyncSession, course_id: str) -> Sequence[Any]:
+        """
+        강의 ID로 공지사항 요약 목록 조회 (본문 제외)
+        반환값: id, article_id, title, date 컬럼만 가진 행 목록
+        """
+        query = select(
+            self.model.id,
+            self.model.article_id,
+            self.model.title,
+            self.model.date
+        ).filter(self.model.course_id == course_id).order_by(self.model.date.desc())
+        result = await db.execute(query)
+        return result.all()
+
     async def get_by_article_id(self, db: AsyncSession, course_id: str, article_id: str) -> Optional[Any]:
         """
         게시글 ID로 공지사항 조회
@@ -37,9 +52,31 @@ class NoticeRepository(BaseRepository[Notice]):
         공지사항 존재 여부 확인
         반환값: 불리언 값 (True/False)
         """
-        query = select(self.model).filter(
+        query = select(exists().where(
             self.model.course_id == course_id,
             self.model.article_id == article_id
-        )
+        ))
         result = await db.execute(query)
-        return result.scalar_one_or_none() is not None
\ No newline at end of file
+        return bool(result.scalar())
+
+    async def bulk_upsert(
+        self, db: AsyncSession, rows: List[Dict[str, Any]], batch_size: int = 500
+    ) -> Dict[str, int]:
+        """
+        공지사항 일괄 저장 (이미 존재하는 (course_id, article_id)는 건너뜀)
+        반환값: 새로 저장된 공지사항의 게시글 ID -> 공지사항 ID 딕셔너리
+        """
+        inserted: Dict[str, int] = {}
+        if not rows:
+            return inserted
+
+        for start in range(0, len(rows), batch_size):
+            stmt = insert(self.model).values(rows[start:start + batch_size])
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=['course_id', 'article_id']
+            ).returning(self.model.article_id, self.model.id)
+            result = await db.execute(stmt)
+            inserted.update({article_id: id for article_id, id in result.all()})
+
+        await db.commit()
+        return inserted
@@ -16,6 +16,7 @@ class Attachment(Base):
     content_type = Column(String)
     storage_path = Column(String, nullable=False)
     original_url = Column(String)
+    course_id = Column(String, ForeignKey("courses.id", name="fk_attachments_course"), nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
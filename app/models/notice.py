@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -14,27 +14,18 @@ class Notice(Base):
     title = Column(String, nullable=False)
     content = Column(Text)
     author = Column(String)
-    date = Column(String)
+    date = Column(DateTime(timezone=True))
     views = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # 강의별 최신순 목록 조회 및 게시글 존재 여부 확인용 인덱스
+        Index('ix_notices_course_date', course_id, date.desc()),
+        Index('ix_notices_course_article', course_id, article_id, unique=True),
+    )
+
     # 관계 정의
     course = relationship("Course", back_populates="notices")
-    attachments = relationship("Attachment", back_populates="notice")
-
-    def to_dict(self) -> dict:
-        """모델을 딕셔너리로 변환"""
-        return {
-            'id': self.id,
-            'article_id': self.article_id,
-            'course_id': self.course_id,
-            'title': self.title,
-            'content': self.content,
-            'author': self.author,
-            'date': self.date,
-            'views': self.views,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'attachments': [attachment.to_dict() for attachment in self.attachments] if self.attachments else []
-        }
\ No newline at end of file
+    # 목록/상세 응답에서 항상 읽으므로 함께 로드 (AsyncSession에서는 지연 로딩 불가)
+    attachments = relationship("Attachment", back_populates="notice", lazy="selectin")
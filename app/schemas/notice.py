@@ -7,7 +7,7 @@ class NoticeBase(BaseModel):
     title: str
     content: Optional[str] = None
     author: Optional[str] = None
-    date: Optional[str] = None
+    date: Optional[datetime] = None
     views: Optional[int] = 0
 
 class NoticeCreate(NoticeBase):
@@ -17,7 +17,7 @@ class NoticeUpdate(BaseModel):
     title: Optional[str] = None
     content: Optional[str] = None
     author: Optional[str] = None
-    date: Optional[str] = None
+    date: Optional[datetime] = None
     views: Optional[int] = None
 
 class NoticeInDBBase(NoticeBase):
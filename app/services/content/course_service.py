@@ -96,11 +96,12 @@ class CourseService(BaseService):
         existing_courses = await self.repository.get_by_user_id(db, user_id)
         existing_course_ids = {course.id for course in existing_courses}
         
-        # 모든 강의 목록 조회 (사용자에 관계없이)
-        all_courses_query = select(Course)
+        # 파싱된 강의 중 이미 저장된 강의 조회 (사용자에 관계없이)
+        parsed_course_ids = [course_data.get('id') for course_data in courses_data]
+        all_courses_query = select(Course).where(Course.id.in_(parsed_course_ids))
         result = await db.execute(all_courses_query)
-        all_courses = result.scalars().all()
-        all_course_ids = {course.id for course in all_courses}
+        all_courses = {course.id: course for course in result.scalars().all()}
+        all_course_ids = set(all_courses)
 
         # 데이터베이스에 강의 정보 저장
         updated_courses = []
@@ -120,7 +121,7 @@ class CourseService(BaseService):
                 # 강의가 데이터베이스에 이미 존재하는지 확인
                 if course_id in all_course_ids:
                     # 기존 강의 찾기
-                    course = next((c for c in all_courses if c.id == course_id), None)
+                    course = all_courses.get(course_id)
                     if course:
                         updated_course = await self.repository.update(
                             db,
@@ -265,22 +266,8 @@ class CourseService(BaseService):
         """
         logger.info(f"사용자 {user_id}의 강의 {course_id} 조회")
 
-        # 강의 정보 조회
-        course = await self.repository.get_by_course_id(db, course_id)
-        
-        if not course:
-            return None
-            
-        # 사용자 접근 권한 확인 (user_courses 테이블을 통해)
-        query = select(exists().where(
-            (user_courses.c.user_id == user_id) & 
-            (user_courses.c.course_id == course_id)
-        ))
-        result = await db.execute(query)
-        if result.scalar():
-            return course
-            
-        return None
+        # 사용자 접근 권한 확인을 겸한 단일 조회 (user_courses 테이블을 통해)
+        return await self.repository.get_by_user_and_course_id(db, user_id, course_id)
 
     async def get_course_menus(self, user_id: str, course_id: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -1,8 +1,10 @@
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.services.content.content_service import ContentService
 from app.services.session import EclassSessionManager
 from app.services.parsers.notice_parser import NoticeParser
@@ -10,9 +12,17 @@ from app.services.storage.storage_service import StorageService
 from app.db.repositories.notice_repository import NoticeRepository
 from app.db.repositories.attachment_repository import AttachmentRepository
 from app.models.notice import Notice
+from app.schemas.notice import Notice as NoticeSchema
 
 logger = logging.getLogger(__name__)
 
+
+def _serialize_notice(notice: Notice) -> Dict[str, Any]:
+    """세션이 닫힌 뒤에도 쓸 수 있도록 공지사항 ORM 객체를 응답용 dict로 변환"""
+    data = NoticeSchema.model_validate(notice).model_dump(exclude={'attachments'})
+    data['attachments'] = [attachment.to_dict() for attachment in notice.attachments]
+    return data
+
 class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
     """공지사항 서비스"""
     
@@ -30,8 +40,28 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
             notice_repository,
             content_type="notices"
         )
+        self.attachment_repository = attachment_repository
+        self.storage_service = storage_service
+        self._list_cache = TTLCache(ttl=settings.NOTICE_LIST_CACHE_TTL)  # course_id -> 공지사항 목록
+    
+    async def get_cached_list(self, db: AsyncSession, course_id: str) -> Sequence[Dict[str, Any]]:
+        """
+        강의 ID로 공지사항 목록 조회 (응답용 dict 목록)
+
+        ORM 모델을 반환하는 get_by_course_id와 달리 직렬화된 목록을 반환한다.
+        목록은 NOTICE_LIST_CACHE_TTL초 동안 캐싱되며, refresh_all에서 새 공지사항과
+        첨부파일이 저장되면 해당 강의의 캐시가 제거된다. 캐시는 요청 간에 공유되므로 요청
+        세션에 묶인 ORM 객체 대신 첨부파일까지 직렬화한 데이터를 저장하며, 호출자가
+        캐시를 변경하지 못하도록 튜플로 보관한다.
+        """
+        notices = self._list_cache.get(course_id)
+        if notices is None:
+            rows = await self.repository.get_by_course_id(db, course_id)
+            notices = tuple(_serialize_notice(notice) for notice in rows)
+            self._list_cache.set(course_id, notices)
+        return notices
     
-    async def get_notices(self, user_id: str, course_id: str, db: AsyncSession) -> List[Notice]:
+    async def get_notices(self, user_id: str, course_id: str, db: AsyncSession) -> Sequence[Dict[str, Any]]:
         """
         특정 강의의 공지사항 목록 조회
         
@@ -41,7 +71,7 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
             db: 데이터베이스 세션
             
         Returns:
-            List[Notice]: 공지사항 목록
+            Sequence[Dict[str, Any]]: 공지사항 목록 (게시일 내림차순)
         """
         try:
             logger.info(f"사용자 {user_id}의 강의 {course_id} 공지사항 조회")
@@ -51,7 +81,7 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
             await verify_course_access(user_id, course_id, db)
             
             # 2. 데이터베이스에서 공지사항 조회
-            notices = await self.repository.get_by_course_id(db, course_id)
+            notices = await self.get_cached_list(db, course_id)
             
             # 3. 공지사항이 없으면 새로고침 시도
             if not notices:
@@ -59,11 +89,11 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
                 result = await self.refresh_all(db, course_id, user_id)
                 if result["new"] > 0:
                     # 새로고침 후 다시 조회
-                    notices = await self.repository.get_by_course_id(db, course_id)
+                    notices = await self.get_cached_list(db, course_id)
             
             # 4. 공지사항 목록 반환
             logger.info(f"강의 {course_id}의 공지사항 {len(notices)}개 반환")
-            return list(notices)
+            return notices
             
         except Exception as e:
             logger.error(f"공지사항 조회 중 오류: {str(e)}")
@@ -124,10 +154,13 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
                 return result
             
             # 4. 기존 공지사항 조회
-            existing_notices = await self.repository.get_by_course_id(db, course_id)
+            existing_notices = await self.repository.get_summaries_by_course_id(db, course_id)
             existing_article_ids = {notice.article_id for notice in existing_notices}
             
-            # 5. 각 공지사항 처리
+            # 5. 각 공지사항 처리 (저장은 마지막에 일괄 처리)
+            new_rows = []
+            attachments_by_article = {}
+
             for notice in notices:
                 result["count"] += 1
                 article_id = notice.get("article_id")
@@ -159,35 +192,45 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
                     # 기본 필드 정보 병합
                     notice.update(notice_detail)
                     
-                    # DB 저장
-                    notice_data = {
+                    new_rows.append({
                         'article_id': article_id,
                         'course_id': course_id,
                         'title': notice.get('title'),
                         'content': notice_detail.get('content'),
-                        'content_html': notice_detail.get('content_html', ''),
                         'author': notice.get('author'),
                         'date': notice.get('date'),
                         'views': notice.get('views'),
-                    }
-                    
-                    created_notice = await self.repository.create(db, notice_data)
-                    result["new"] += 1
-                    
-                    # 첨부파일 처리
-                    if auto_download and notice.get("attachments"):
-                        attachment_count = await self._process_attachments(
-                            db,
-                            eclass_session,
-                            notice["attachments"],
-                            created_notice.id,
-                            course_id
-                        )
-                        logger.info(f"처리된 첨부파일 수: {attachment_count}")
+                    })
+                    existing_article_ids.add(article_id)
+
+                    if notice.get("attachments"):
+                        attachments_by_article[article_id] = notice["attachments"]
                     
                 except Exception as e:
                     logger.error(f"공지사항 {article_id} 처리 중 오류: {str(e)}")
                     result["errors"] += 1
+
+            # 6. DB 일괄 저장
+            inserted = await self.repository.bulk_upsert(db, new_rows)
+            result["new"] = len(inserted)
+
+            # 7. 첨부파일 처리
+            if auto_download:
+                for article_id, notice_id in inserted.items():
+                    if article_id not in attachments_by_article:
+                        continue
+                    attachment_count = await self._process_attachments(
+                        db,
+                        eclass_session,
+                        attachments_by_article[article_id],
+                        notice_id,
+                        course_id
+                    )
+                    logger.info(f"처리된 첨부파일 수: {attachment_count}")
+
+            # 8. 첨부파일까지 저장된 뒤에 목록 캐시 제거
+            if inserted:
+                self._list_cache.pop(course_id)
             
             return result
             
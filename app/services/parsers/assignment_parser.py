@@ -1,11 +1,24 @@
-from typing import List, Dict, Any
-import re
+from typing import List, Dict, Any, Optional, Union
 import logging
-from bs4 import BeautifulSoup
-from app.services.parsers.content_parser import ContentParser
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from lxml import html as lxml_html
+from app.services.parsers.content_parser import ContentParser, ensure_tree, has_class, text_with_breaks
 
 logger = logging.getLogger(__name__)
 
+# 목록 파싱 시 과제 테이블만 트리로 구성
+_ASSIGNMENT_TABLE_STRAINER = SoupStrainer('table', class_='table_topic')
+
+# 상세 파싱에 사용하는 XPath (라벨 텍스트는 EXSLT 정규식으로 검색)
+_EXSLT_NS = {'re': 'http://exslt.org/regular-expressions'}
+_CONTENT_TD = etree.XPath(f'(//table[{has_class("bbsview")}])[1]//td[{has_class("textviewer")}]')
+_DUE_DATE_LABEL = etree.XPath('(//text()[re:test(., "마감일|제출기한")])[1]', namespaces=_EXSLT_NS)
+_SCORE_LABEL = etree.XPath('(//text()[re:test(., "배점|점수")])[1]', namespaces=_EXSLT_NS)
+_MY_SCORE_LABEL = etree.XPath('(//text()[re:test(., "내 점수|획득 점수")])[1]', namespaces=_EXSLT_NS)
+_NEXT_SIBLING = etree.XPath('following-sibling::*[1]')
+
+
 class AssignmentParser(ContentParser):
     """과제 파싱 클래스"""
     
@@ -15,7 +28,7 @@ class AssignmentParser(ContentParser):
             if not html:
                 return []
                 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml', parse_only=_ASSIGNMENT_TABLE_STRAINER)
             # 과제 테이블 찾기
             assignment_table = soup.find('table', class_='table_topic')
             if not assignment_table:
@@ -24,6 +37,8 @@ class AssignmentParser(ContentParser):
                 
             # 과제 행 찾기
             assignment_rows = assignment_table.find_all('tr')[1:]  # 헤더 제외
+            if not assignment_rows:
+                return []
             
             assignments = []
             for row in assignment_rows:
@@ -31,6 +46,7 @@ class AssignmentParser(ContentParser):
                     cols = row.find_all('td')
                     if len(cols) < 7:  # 과제 행은 보통 7개 이상의 열을 가짐
                         continue
+                    _, title_td, _, start_td, end_td, status_td = cols[:6]
                         
                     # onclick 속성에서 URL 추출
                     onclick_value = row.get('onclick', '')
@@ -44,10 +60,10 @@ class AssignmentParser(ContentParser):
                         
                     assignment = {
                         'assignment_id': assignment_id,
-                        'title': cols[1].text.strip(),
-                        'start_date': cols[3].text.strip(),
-                        'end_date': cols[4].text.strip(),
-                        'status': cols[5].text.strip(),
+                        'title': title_td.text.strip(),
+                        'start_date': start_td.text.strip(),
+                        'end_date': end_td.text.strip(),
+                        'status': status_td.text.strip(),
                         'url': detail_url
                     }
                     assignments.append(assignment)
@@ -62,55 +78,55 @@ class AssignmentParser(ContentParser):
             logger.error(f"과제 목록 파싱 중 오류 발생: {e}")
             return []
     
-    def parse_detail(self, html: str) -> Dict[str, Any]:
-        """과제 상세 내용 파싱"""
+    def _find_labeled_value(self, tree: lxml_html.HtmlElement, label_xpath: etree.XPath) -> Optional[str]:
+        """라벨 텍스트를 감싼 요소의 다음 형제 요소 텍스트 추출"""
+        labels = label_xpath(tree)
+        if not labels:
+            return None
+        label = labels[0]
+        # tail 텍스트라면 실제로 감싸고 있는 요소는 한 단계 위
+        parent = label.getparent()
+        if label.is_tail and parent is not None:
+            parent = parent.getparent()
+        if parent is None:
+            return None
+        siblings = _NEXT_SIBLING(parent)
+        if not siblings:
+            return None
+        return self.clean_text(siblings[0].text_content())
+    
+    def parse_detail(self, html: Union[str, lxml_html.HtmlElement]) -> Dict[str, Any]:
+        """과제 상세 내용 파싱 (HTML 문자열 또는 이미 파싱된 lxml 트리)"""
         try:
-            if not html:
+            tree = ensure_tree(html)
+            if tree is None:
                 return {}
                 
-            soup = BeautifulSoup(html, 'html.parser')
             detail = {}
             
-            # 과제 테이블 찾기
-            assignment_table = soup.find('table', class_='bbsview')
-            if assignment_table:
-                # 과제 내용 추출
-                content_td = assignment_table.find('td', class_='textviewer')
-                if content_td:
-                    # HTML 태그 처리
-                    for br in content_td.find_all('br'):
-                        br.replace_with('\n')
-                    for p in content_td.find_all('p'):
-                        p.insert_after(soup.new_string('\n'))
-                    
-                    detail['content'] = content_td.get_text(strip=True)
-                    detail['content_html'] = str(content_td)
+            # 과제 내용 추출
+            content_tds = _CONTENT_TD(tree)
+            if content_tds:
+                content_td = content_tds[0]
+                detail['content'] = text_with_breaks(content_td)
+                detail['content_html'] = lxml_html.tostring(content_td, encoding='unicode', with_tail=False)
                     
             # 마감일 추출 (상세 페이지에서 다시 확인)
-            due_date = ""
-            due_date_label = soup.find(string=re.compile('마감일|제출기한'))
-            if due_date_label and due_date_label.parent:
-                due_date_elem = due_date_label.parent.find_next_sibling()
-                if due_date_elem:
-                    due_date = self.clean_text(due_date_elem.text)
+            due_date = self._find_labeled_value(tree, _DUE_DATE_LABEL) or ""
                     
             # 점수 정보 추출
             score_info = {}
-            score_label = soup.find(string=re.compile('배점|점수'))
-            if score_label and score_label.parent:
-                score_elem = score_label.parent.find_next_sibling()
-                if score_elem:
-                    score_info['max_score'] = self.clean_text(score_elem.text)
+            max_score = self._find_labeled_value(tree, _SCORE_LABEL)
+            if max_score is not None:
+                score_info['max_score'] = max_score
                     
             # 내 점수 정보 추출 (제출한 경우)
-            my_score_label = soup.find(string=re.compile('내 점수|획득 점수'))
-            if my_score_label and my_score_label.parent:
-                my_score_elem = my_score_label.parent.find_next_sibling()
-                if my_score_elem:
-                    score_info['my_score'] = self.clean_text(my_score_elem.text)
+            my_score = self._find_labeled_value(tree, _MY_SCORE_LABEL)
+            if my_score is not None:
+                score_info['my_score'] = my_score
                     
             # 기본 첨부파일 추출 (페이지에 있는 경우)
-            attachments = self.parse_attachments(html)
+            attachments = self.parse_attachments(tree)
             
             # 결과 취합
             if due_date:
@@ -1,11 +1,195 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, Union
+import asyncio
+import copy
+import functools
+import hashlib
 import re
+import threading
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 import logging
 
 logger = logging.getLogger(__name__)
 
+# e-Class 게시일은 한국 표준시 기준
+KST = timezone(timedelta(hours=9))
+DATE_FORMATS = ('%Y-%m-%d %H:%M', '%Y.%m.%d %H:%M', '%Y-%m-%d', '%Y.%m.%d')
+
+# 반복 호출되는 정규식은 모듈 로드 시 한 번만 컴파일
+RE_WHITESPACE = re.compile(r'\s+')
+RE_DIGITS = re.compile(r'\d+')
+_RE_PAGEMOVE = re.compile(r"pageMove\('([^']+)'(?:,\s*event)?")
+_RE_ARTICLE_ID = re.compile(r'(?:ARTL_NUM|NORCT_NUM)=(\d+)')
+_RE_FILE_SEQ = re.compile(r'FILE_SEQ=([^&]+)')
+_RE_CONTENT_SEQ_PARAM = re.compile(r'CONTENT_SEQ=([^&]+)')
+_RE_CONTENT_SEQ = re.compile(r'CONTENT_SEQ\s*:\s*["\']([^"\',]+)')
+
+# 스레드별 lxml 파서 보관소 (_html_parser 참고)
+_parser_local = threading.local()
+
+# CONTENT_SEQ 탐색 XPath (hidden input → 인라인 스크립트 → 링크 순서로 확인)
+_CONTENT_SEQ_VALUE = etree.XPath('(//input[@name="CONTENT_SEQ"])[1]/@value')
+_CONTENT_SEQ_SCRIPTS = etree.XPath('//script/text()[contains(., "CONTENT_SEQ")]')
+_CONTENT_SEQ_HREF = etree.XPath('(//a[contains(@href, "CONTENT_SEQ=")])[1]/@href')
+
+# 첨부파일 다운로드 링크 (href 조건을 libxml2에서 평가)
+_ATTACHMENT_LINKS = etree.XPath('//a[contains(@href, "efile_download.acl")]')
+
+# 목록에서 상세 페이지로 이동하는 행의 style 값
+_CLICKABLE_ROW_STYLE = 'cursor: pointer'
+
+# 목록 페이지를 스트리밍 파싱할 때 한 번에 넣는 HTML 크기
+_FEED_CHUNK_SIZE = 64 * 1024
+
+
+def has_class(class_name: str) -> str:
+    """class 속성에 class_name이 포함되었는지 확인하는 XPath 조건식"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {class_name} ")'
+
+
+# 목록 행(공지사항/강의자료) 공통 XPath
+TITLE_CELLS = etree.XPath(f'./td[{has_class("left")}]')
+SUBJECT_TOP = etree.XPath(f'.//*[{has_class("subjt_top")}]')
+SUBJECT_BOTTOM = etree.XPath(f'.//*[{has_class("subjt_bottom")}]')
+SPANS = etree.XPath('.//span')
+
+
+def cache_by_html(maxsize: int = 64) -> Callable:
+    """
+    같은 HTML에 대한 파싱 결과를 재사용하는 LRU 캐시 데코레이터
+
+    HTML 원문 대신 blake2b 다이제스트를 키로 저장하며, 호출자가 결과를
+    수정해도 캐시가 오염되지 않도록 복사본을 반환합니다.
+    """
+    def decorator(method: Callable) -> Callable:
+        cache: OrderedDict = OrderedDict()
+
+        @functools.wraps(method)
+        def wrapper(self, html: str):
+            if not html:
+                return method(self, html)
+
+            key = hashlib.blake2b(html.encode('utf-8'), digest_size=16).digest()
+            if key in cache:
+                cache.move_to_end(key)
+                return copy.deepcopy(cache[key])
+
+            result = method(self, html)
+            if result:
+                cache[key] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return copy.deepcopy(result)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def _html_parser(encoding: Optional[str] = None) -> lxml_html.HTMLParser:
+    """
+    현재 스레드에서 재사용하는 lxml HTML 파서 반환
+
+    lxml 파서는 동시에 한 스레드만 사용할 수 있으므로 여러 스레드에서 파싱해도
+    서로 기다리지 않도록 스레드별로 하나씩 생성해 둡니다.
+    """
+    parsers = getattr(_parser_local, 'parsers', None)
+    if parsers is None:
+        parsers = _parser_local.parsers = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        parser = parsers[encoding] = lxml_html.HTMLParser(
+            recover=True, remove_comments=True, encoding=encoding
+        )
+    return parser
+
+
+def parse_html(html: Union[str, bytes]) -> lxml_html.HtmlElement:
+    """HTML 문자열 또는 UTF-8 바이트를 lxml 트리로 변환 (바이트는 디코딩 없이 바로 파싱)"""
+    if isinstance(html, bytes):
+        # e-Class 응답은 UTF-8이며 meta 태그가 없는 조각도 있으므로 인코딩을 지정
+        return lxml_html.fromstring(html, parser=_html_parser('utf-8'))
+    return lxml_html.fromstring(html, parser=_html_parser())
+
+
+def ensure_tree(html: Union[str, bytes, lxml_html.HtmlElement]) -> Optional[lxml_html.HtmlElement]:
+    """HTML 문자열/바이트는 lxml 트리로 변환하고, 이미 파싱된 트리는 그대로 반환 (빈 입력은 None)"""
+    if isinstance(html, (str, bytes)):
+        if not html.strip():
+            return None
+        return parse_html(html)
+    return html
+
+
+def element_text(element: lxml_html.HtmlElement) -> str:
+    """요소의 텍스트를 앞뒤 공백 없이 반환 (자식이 없는 셀은 .text만 읽음)"""
+    if len(element):
+        return element.text_content().strip()
+    return (element.text or '').strip()
+
+
+def text_with_breaks(element: lxml_html.HtmlElement) -> str:
+    """
+    요소의 텍스트를 <br>, </p> 위치에 줄바꿈을 넣어 한 번의 순회로 추출
+
+    트리를 수정하지 않으며, 각 줄의 앞뒤 공백과 빈 줄은 제거합니다.
+    """
+    parts = []
+    for event, node in etree.iterwalk(element, events=('start', 'end', 'comment')):
+        if event == 'start':
+            if node.tag == 'br':
+                parts.append('\n')
+            elif node.text:
+                parts.append(node.text)
+            continue
+        if event == 'end' and node.tag == 'p':
+            parts.append('\n')
+        # 주석은 'comment' 이벤트 한 번만 발생하므로 여기서 tail만 이어 붙임
+        if node is not element and node.tail:
+            parts.append(node.tail)
+
+    lines = (line.strip() for line in ''.join(parts).splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def has_clickable_rows(html: str) -> bool:
+    """파싱 전에 클릭 가능한 행이 있을 수 있는지 문자열 검색으로 빠르게 확인"""
+    return _CLICKABLE_ROW_STYLE in html
+
+
+def iter_clickable_rows(html: str) -> Iterator[lxml_html.HtmlElement]:
+    """
+    목록 페이지에서 클릭 가능한 행(style에 'cursor: pointer')을 스트리밍으로 순회
+
+    전체 트리를 먼저 만들지 않고 HTML을 나눠 파싱하며, 처리가 끝난 행은
+    바로 비워서 메모리에 한 행 분량만 남도록 합니다.
+    """
+    parser = etree.HTMLPullParser(events=('end',), tag='tr', remove_comments=True)
+    parser.set_element_class_lookup(lxml_html.HtmlElementClassLookup())
+
+    def drain():
+        for _, row in parser.read_events():
+            if _CLICKABLE_ROW_STYLE in row.get('style', ''):
+                yield row
+            # 다른 행 안에 중첩된 행은 바깥 행을 처리할 때 필요하므로 유지
+            if next(row.iterancestors('tr'), None) is not None:
+                continue
+            row.clear()
+            parent = row.getparent()
+            while parent is not None and row.getprevious() is not None:
+                del parent[0]
+
+    for start in range(0, len(html), _FEED_CHUNK_SIZE):
+        parser.feed(html[start:start + _FEED_CHUNK_SIZE])
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
 class ContentParser(ABC):
     """
     콘텐츠 파싱을 위한 추상 기본 클래스.
@@ -17,17 +201,27 @@ class ContentParser(ABC):
         if not text:
             return ""
         # 공백 문자 정리
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = RE_WHITESPACE.sub(' ', text.strip())
         # HTML 엔티티 변환
         text = text.replace('&nbsp;', ' ').replace('&lt;', '<').replace('&gt;', '>')
         return text
     
+    def parse_date(self, text: str) -> Optional[datetime]:
+        """게시일 문자열을 KST 기준 datetime으로 변환"""
+        text = (text or '').strip()
+        for date_format in DATE_FORMATS:
+            try:
+                return datetime.strptime(text, date_format).replace(tzinfo=KST)
+            except ValueError:
+                continue
+        return None
+    
     def extract_table_data(self, html: str, selector: str) -> List[Dict[str, Any]]:
         """HTML 테이블에서 데이터 추출"""
         if not html:
             return []
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         table = soup.select_one(selector)
         if not table:
             return []
@@ -66,28 +260,34 @@ class ContentParser(ABC):
             
         return result
     
-    def extract_content_seq(self, html: str) -> Optional[str]:
-        """CONTENT_SEQ 파라미터 추출"""
-        if not html:
+    def extract_content_seq(self, html: Union[str, lxml_html.HtmlElement]) -> Optional[str]:
+        """
+        CONTENT_SEQ 파라미터 추출
+        
+        Args:
+            html: HTML 문자열 또는 이미 파싱된 lxml 트리 (트리를 넘기면 다시 파싱하지 않음)
+        """
+        tree = ensure_tree(html)
+        if tree is None:
             return None
-            
-        # URL에서 추출 시도
-        url_match = re.search(r'CONTENT_SEQ=([^&]+)', html)
-        if url_match:
-            return url_match.group(1)
+        
+        # hidden input에서 추출 시도
+        values = _CONTENT_SEQ_VALUE(tree)
+        if values and values[0]:
+            return str(values[0])
             
         # 스크립트에서 추출 시도
-        soup = BeautifulSoup(html, 'html.parser')
-        for script in soup.find_all('script'):
-            if script.string and 'CONTENT_SEQ' in script.string:
-                match = re.search(r'CONTENT_SEQ\s*:\s*["\']([^"\',]+)', script.string)
-                if match:
-                    return match.group(1)
+        for script in _CONTENT_SEQ_SCRIPTS(tree):
+            match = _RE_CONTENT_SEQ.search(script)
+            if match:
+                return match.group(1)
                     
-        # hidden input에서 추출 시도
-        seq_input = soup.select_one('input[name="CONTENT_SEQ"]')
-        if seq_input:
-            return seq_input.get('value')
+        # 링크 URL에서 추출 시도
+        hrefs = _CONTENT_SEQ_HREF(tree)
+        if hrefs:
+            url_match = _RE_CONTENT_SEQ_PARAM.search(hrefs[0])
+            if url_match:
+                return url_match.group(1)
             
         return None
     
@@ -97,16 +297,12 @@ class ContentParser(ABC):
             return None
 
         # ARTL_NUM 또는 NORCT_NUM 파라미터 찾기
-        for param in ['ARTL_NUM', 'NORCT_NUM']:
-            match = re.search(fr'{param}=([\d]+)', url)
-            if match:
-                return match.group(1)
-
-        return None
+        match = _RE_ARTICLE_ID.search(url)
+        return match.group(1) if match else None
     
     def extract_url_from_onclick(self, onclick_value: str) -> str:
         """onclick 속성에서 URL 추출"""
-        match = re.search(r"pageMove\('([^']+)'(?:,\s*event)?", onclick_value)
+        match = _RE_PAGEMOVE.search(onclick_value)
         if match:
             url = match.group(1)
             base_url = "https://eclass.seoultech.ac.kr"
@@ -115,20 +311,24 @@ class ContentParser(ABC):
             return url
         return ""
     
-    def parse_attachments(self, html: str) -> List[Dict[str, Any]]:
-        """첨부파일 정보 파싱"""
+    def parse_attachments(self, html: Union[str, bytes, lxml_html.HtmlElement]) -> List[Dict[str, Any]]:
+        """
+        첨부파일 정보 파싱
+        
+        Args:
+            html: HTML 문자열, UTF-8 바이트 또는 이미 파싱된 lxml 트리 (트리를 넘기면 다시 파싱하지 않음)
+        """
         attachments = []
         
-        if not html:
+        tree = ensure_tree(html)
+        if tree is None:
             return attachments
-            
-        soup = BeautifulSoup(html, 'html.parser')
         
         # 첨부파일 링크 찾기
-        for file_link in soup.find_all('a', href=lambda h: h and 'efile_download.acl' in h):
+        for file_link in _ATTACHMENT_LINKS(tree):
             try:
                 file_url = file_link.get('href', '')
-                file_name = file_link.text.strip()
+                file_name = element_text(file_link)
 
                 # 상대 URL인 경우 절대 URL로 변환
                 if file_url and not file_url.startswith('http'):
@@ -140,7 +340,7 @@ class ContentParser(ABC):
                 }
                 
                 # FILE_SEQ 추출
-                file_seq_match = re.search(r'FILE_SEQ=([^&]+)', file_url)
+                file_seq_match = _RE_FILE_SEQ.search(file_url)
                 if file_seq_match:
                     attachment['file_seq'] = file_seq_match.group(1)
                 
@@ -153,21 +353,13 @@ class ContentParser(ABC):
                 
         return attachments
     
-    async def fetch_attachments_via_ajax(self, eclass_session, content_seq: str, course_id: str) -> List[Dict[str, Any]]:
+    async def _fetch_attachments_html(self, eclass_session, course_id: str, content_seq: str) -> Optional[bytes]:
         """
-        AJAX 요청을 통해 첨부파일 목록 가져오기
+        AJAX 요청으로 첨부파일 목록 HTML만 가져오기 (파싱하지 않음)
         
-        Args:
-            eclass_session: E-Class 세션 객체
-            content_seq: 콘텐츠 시퀀스 번호
-            course_id: 강의 ID
-            
         Returns:
-            List[Dict[str, Any]]: 첨부파일 정보 목록
+            Optional[bytes]: 첨부파일 목록 HTML 원본 바이트 (실패 시 None)
         """
-        if not content_seq or not course_id or not eclass_session:
-            return []
-            
         try:
             # AJAX 요청 URL 및 데이터
             efile_list_url = "https://eclass.seoultech.ac.kr/ilos/co/efile_list.acl"
@@ -181,16 +373,38 @@ class ContentParser(ABC):
             # AJAX 요청 수행
             response = await eclass_session.post(efile_list_url, data=form_data)
             
-            if not response or not response.text:
+            if not response or not response.content:
                 logger.error("첨부파일 목록 AJAX 요청 실패")
-                return []
+                return None
                 
-            # 첨부파일 정보 파싱
-            return self.parse_attachments(response.text)
+            # 문자열로 디코딩하지 않고 lxml에 바이트를 그대로 전달
+            return response.content
             
         except Exception as e:
             logger.error(f"첨부파일 AJAX 요청 중 오류: {str(e)}")
+            return None
+    
+    async def fetch_attachments_via_ajax(self, eclass_session, content_seq: str, course_id: str) -> List[Dict[str, Any]]:
+        """
+        AJAX 요청을 통해 첨부파일 목록 가져오기
+        
+        Args:
+            eclass_session: E-Class 세션 객체
+            content_seq: 콘텐츠 시퀀스 번호
+            course_id: 강의 ID
+            
+        Returns:
+            List[Dict[str, Any]]: 첨부파일 정보 목록
+        """
+        if not content_seq or not course_id or not eclass_session:
+            return []
+            
+        file_list_html = await self._fetch_attachments_html(eclass_session, course_id, content_seq)
+        if not file_list_html:
             return []
+            
+        # 첨부파일 정보 파싱
+        return self.parse_attachments(file_list_html)
     
     @abstractmethod
     def parse_list(self, html: str) -> List[Dict[str, Any]]:
@@ -198,10 +412,28 @@ class ContentParser(ABC):
         pass
     
     @abstractmethod
-    def parse_detail(self, html: str) -> Dict[str, Any]:
-        """콘텐츠 상세 페이지 파싱"""
+    def parse_detail(self, html: Union[str, lxml_html.HtmlElement]) -> Dict[str, Any]:
+        """콘텐츠 상세 페이지 파싱 (HTML 문자열 또는 이미 파싱된 lxml 트리)"""
         pass
+    
+    def _parse_detail_and_content_seq(self, html: str) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        상세 페이지를 한 번 파싱해 상세 정보와 (첨부파일이 없을 때) CONTENT_SEQ를 함께 반환
         
+        CPU 작업만 수행하므로 parse_detail_with_attachments에서 워커 스레드로 실행합니다.
+        """
+        tree = ensure_tree(html)
+        if tree is None:
+            return {}, None
+        
+        # 기본 상세 정보 파싱
+        result = self.parse_detail(tree)
+        
+        # 첨부파일이 이미 파싱되었으면 CONTENT_SEQ는 필요 없음
+        if result.get('attachments'):
+            return result, None
+        return result, self.extract_content_seq(tree)
+    
     async def parse_detail_with_attachments(self, eclass_session, html: str, course_id: str) -> Dict[str, Any]:
         """
         첨부파일 정보를 포함한 콘텐츠 상세 페이지 파싱
@@ -214,27 +446,24 @@ class ContentParser(ABC):
         Returns:
             Dict[str, Any]: 파싱 결과 (첨부파일 정보 포함)
         """
+        result: Dict[str, Any] = {}
         try:
-            # 기본 상세 정보 파싱
-            result = self.parse_detail(html)
+            # 파싱은 워커 스레드에서 실행해 동시에 크롤링 중인 다른 강의의 요청을 막지 않음
+            # (libxml2 파싱 중에는 GIL이 풀리므로 여러 상세 페이지가 병렬로 파싱됨)
+            result, content_seq = await asyncio.to_thread(self._parse_detail_and_content_seq, html)
             
-            # 첨부파일이 이미 파싱되었는지 확인
-            if not result.get('attachments') or len(result['attachments']) == 0:
-                # CONTENT_SEQ 추출
-                content_seq = self.extract_content_seq(html)
+            if content_seq:
+                # AJAX 요청으로 첨부파일 정보 가져오기
+                attachments = await self.fetch_attachments_via_ajax(
+                    eclass_session, content_seq, course_id
+                )
                 
-                if content_seq:
-                    # AJAX 요청으로 첨부파일 정보 가져오기
-                    attachments = await self.fetch_attachments_via_ajax(
-                        eclass_session, content_seq, course_id
-                    )
-                    
-                    if attachments:
-                        result['attachments'] = attachments
+                if attachments:
+                    result['attachments'] = attachments
             
             return result
             
         except Exception as e:
             logger.error(f"첨부파일 정보 포함 상세 파싱 중 오류: {str(e)}")
-            # 기본 파싱 결과라도 반환
-            return self.parse_detail(html)
+            # 이미 파싱한 기본 결과라도 반환 (다시 파싱하지 않음)
+            return result
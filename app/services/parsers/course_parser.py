@@ -1,34 +1,43 @@
 from typing import List, Dict, Any
 import re
-from bs4 import BeautifulSoup
+from lxml import etree
 import logging
-from app.services.parsers.content_parser import ContentParser
+from app.services.parsers.content_parser import ContentParser, cache_by_html, element_text, has_class, parse_html
 
 logger = logging.getLogger(__name__)
 
+# 메뉴 파싱에 사용하는 XPath (모듈 로드 시 한 번만 컴파일)
+_COURSE_ITEMS = etree.XPath('//li[contains(@style, "background: url")]')
+_COURSE_NAMES = etree.XPath(f'.//em[{has_class("sub_open")}]')
+_FIRST_SPAN = etree.XPath('(.//span)[1]')
+_MENU_ITEMS = etree.XPath(f'//li[{has_class("course_menu_item")}]')
+_FIRST_LINK = etree.XPath('(.//a)[1]')
+
 class CourseParser(ContentParser):
     """강의 정보 파싱 클래스"""
     
+    @cache_by_html()
     def parse_list(self, html: str) -> List[Dict[str, Any]]:
         """강의 목록 페이지 파싱"""
         try:
             if not html:
                 return []
                 
-            soup = BeautifulSoup(html, 'html.parser')
-            course_elements = soup.find_all('li', style=lambda value: value and 'background: url' in value)
+            tree = parse_html(html)
+            course_elements = _COURSE_ITEMS(tree)
             
             courses = []
             for element in course_elements:
                 try:
                     # 강의명 요소 찾기
-                    name_elem = element.find('em', class_='sub_open')
-                    if not name_elem:
+                    name_elems = _COURSE_NAMES(element)
+                    if not name_elems:
                         continue
+                    name_elem = name_elems[0]
                         
                     # 강의 ID 추출
                     course_id = name_elem.get('kj')
-                    full_name = name_elem.text.strip()
+                    full_name = element_text(name_elem)
                     
                     # 강의명과 코드 분리
                     name_parts = full_name.rsplit('(', 1)
@@ -36,8 +45,8 @@ class CourseParser(ContentParser):
                     course_code = name_parts[1].strip(') ') if len(name_parts) > 1 else ''
                     
                     # 강의 시간 추출
-                    time_elem = element.find('span')
-                    course_time = time_elem.text.strip() if time_elem else ''
+                    time_elems = _FIRST_SPAN(element)
+                    course_time = element_text(time_elems[0]) if time_elems else ''
                     
                     # 결과 추가
                     if course_id and course_name:
@@ -66,13 +75,14 @@ class CourseParser(ContentParser):
         """
         return {'menus': self.parse_course_menus(html)}
     
+    @cache_by_html()
     def parse_course_menus(self, html: str) -> Dict[str, Dict[str, str]]:
         """강의 메뉴 파싱"""
         try:
             if not html:
                 return {}
                 
-            soup = BeautifulSoup(html, 'html.parser')
+            tree = parse_html(html)
             menus = {}
             
             # 메뉴 매핑 정의
@@ -88,16 +98,19 @@ class CourseParser(ContentParser):
             }
             
             # 메뉴 항목 찾기
-            menu_items = soup.find_all('li', class_='course_menu_item')
+            menu_items = _MENU_ITEMS(tree)
+            if not menu_items:
+                return {}
             
             for item in menu_items:
                 try:
                     menu_id = item.get('id', '')
                     if menu_id in menu_mapping:
-                        link = item.find('a')
-                        if link:
-                            menu_name = link.text.strip()
-                            menu_url = link['href']
+                        links = _FIRST_LINK(item)
+                        if links:
+                            link = links[0]
+                            menu_name = element_text(link)
+                            menu_url = link.attrib['href']
                             menus[menu_mapping[menu_id]] = {
                                 'name': menu_name,
                                 'url': menu_url
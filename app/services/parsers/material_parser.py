@@ -1,11 +1,24 @@
-from typing import List, Dict, Any
-import re
+from typing import List, Dict, Any, Union
 import logging
-from bs4 import BeautifulSoup
-from app.services.parsers.content_parser import ContentParser
+from lxml import etree
+from lxml import html as lxml_html
+from app.services.parsers.content_parser import (
+    RE_DIGITS, SPANS, SUBJECT_BOTTOM, SUBJECT_TOP, TITLE_CELLS, ContentParser, element_text,
+    ensure_tree, has_class, has_clickable_rows, iter_clickable_rows
+)
 
 logger = logging.getLogger(__name__)
 
+# 목록 파싱에 사용하는 XPath (모듈 로드 시 한 번만 컴파일)
+_DATE_CELLS = etree.XPath(f'./*[last()][self::td][{has_class("number")}]')
+_DOWNLOAD_ICONS = etree.XPath(f'.//img[{has_class("download_icon")}]')
+
+# 상세 파싱에 사용하는 XPath
+_TEXTVIEWER = etree.XPath(f'(//td[{has_class("textviewer")}])[1]')
+_VISIBLE_TEXT = etree.XPath('.//text()[not(parent::script) and not(parent::style)]')
+_VIDEO_SOURCE = etree.XPath('(//video//source)[1]')
+_IFRAME = etree.XPath('(//iframe)[1]')
+
 class MaterialParser(ContentParser):
     """강의자료 파싱 클래스"""
     
@@ -15,24 +28,25 @@ class MaterialParser(ContentParser):
             if not html:
                 return []
                 
-            soup = BeautifulSoup(html, 'html.parser')
-            material_rows = soup.select('tr[style*="cursor: pointer"]')
-            
-            if not material_rows:
+            # 대상 행이 없으면 파싱 없이 바로 종료
+            if not has_clickable_rows(html):
                 logger.warning("강의자료 목록을 찾을 수 없습니다.")
                 return []
                 
             materials = []
-            for row in material_rows:
+            row_count = 0
+            for row in iter_clickable_rows(html):
+                row_count += 1
                 try:
                     # 공지 글은 건너뛰기
-                    if row.get('class') and any(cls in ['gongji', 'notitop'] for cls in row.get('class')):
+                    if any(cls in ['gongji', 'notitop'] for cls in row.get('class', '').split()):
                         continue
                         
                     # 제목 열 찾기
-                    title_cell = row.select_one('td.left')
-                    if not title_cell:
+                    title_cells = TITLE_CELLS(row)
+                    if not title_cells:
                         continue
+                    title_cell = title_cells[0]
                         
                     # URL 및 article_id 추출
                     onclick = title_cell.get('onclick', '')
@@ -48,33 +62,34 @@ class MaterialParser(ContentParser):
                         continue
                         
                     # 제목 추출
-                    title_div = title_cell.select_one('.subjt_top')
-                    title = title_div.get_text(strip=True) if title_div else ""
+                    title_divs = SUBJECT_TOP(title_cell)
+                    title = element_text(title_divs[0]) if title_divs else ""
                     
                     # 작성자 추출
                     author = ""
-                    subjt_bottom = title_cell.select_one('.subjt_bottom')
-                    if subjt_bottom:
-                        author_span = subjt_bottom.select_one('span')
-                        if author_span:
-                            author = author_span.get_text(strip=True)
+                    subjt_bottoms = SUBJECT_BOTTOM(title_cell)
+                    subjt_bottom = subjt_bottoms[0] if subjt_bottoms else None
+                    if subjt_bottom is not None:
+                        author_spans = SPANS(subjt_bottom)
+                        if author_spans:
+                            author = element_text(author_spans[0])
                             
                     # 날짜 추출
-                    date_cell = row.select_one('td.number:last-child')
-                    date = date_cell.get_text(strip=True) if date_cell else ""
+                    date_cells = _DATE_CELLS(row)
+                    date = element_text(date_cells[0]) if date_cells else ""
                     
                     # 조회수 추출
                     views = "0"
-                    if subjt_bottom:
-                        spans = subjt_bottom.find_all('span')
+                    if subjt_bottom is not None:
+                        spans = SPANS(subjt_bottom)
                         if len(spans) > 1:
-                            views_text = spans[-1].get_text(strip=True)
-                            views_match = re.search(r'\d+', views_text)
+                            views_text = element_text(spans[-1])
+                            views_match = RE_DIGITS.search(views_text)
                             if views_match:
                                 views = views_match.group()
                     
                     # 첨부파일 아이콘 확인
-                    download_icons = row.select('img.download_icon')
+                    download_icons = _DOWNLOAD_ICONS(row)
                     has_attachment = len(download_icons) > 0
                     
                     material = {
@@ -92,38 +107,44 @@ class MaterialParser(ContentParser):
                     logger.error(f"강의자료 행 파싱 중 오류: {str(e)}")
                     continue
                     
+            if not row_count:
+                logger.warning("강의자료 목록을 찾을 수 없습니다.")
+                
             return materials
             
         except Exception as e:
             logger.error(f"강의자료 목록 파싱 중 오류 발생: {e}")
             return []
     
-    def parse_detail(self, html: str) -> Dict[str, Any]:
-        """강의자료 상세 페이지 파싱"""
+    def parse_detail(self, html: Union[str, lxml_html.HtmlElement]) -> Dict[str, Any]:
+        """강의자료 상세 페이지 파싱 (HTML 문자열 또는 이미 파싱된 lxml 트리)"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            tree = ensure_tree(html)
+            if tree is None:
+                return {}
             parsed_data = {}
             
-            # 본문 내용 추출
-            content_element = soup.select_one('td.textviewer')
-            if content_element:
-                parsed_data['content'] = content_element.get_text(strip=True)
-                parsed_data['content_html'] = str(content_element)
+            # 본문 내용 추출 (각 텍스트 조각의 앞뒤 공백을 제거해 이어 붙임)
+            content_elements = _TEXTVIEWER(tree)
+            if content_elements:
+                content_element = content_elements[0]
+                parsed_data['content'] = ''.join(text.strip() for text in _VISIBLE_TEXT(content_element))
+                parsed_data['content_html'] = lxml_html.tostring(content_element, encoding='unicode', with_tail=False)
                 
             # 기본 첨부파일 추출 (페이지에 있는 경우)
-            attachments = self.parse_attachments(html)
+            attachments = self.parse_attachments(tree)
             if attachments:
                 parsed_data['attachments'] = attachments
                 
             # 영상 URL 추출 (HTML5 비디오 또는 iframe)
             video_url = ""
-            video_elem = soup.select_one('video source')
-            if video_elem and 'src' in video_elem.attrs:
-                video_url = video_elem['src']
+            video_elems = _VIDEO_SOURCE(tree)
+            if video_elems and 'src' in video_elems[0].attrib:
+                video_url = video_elems[0].get('src')
             else:
-                iframe_elem = soup.select_one('iframe')
-                if iframe_elem and 'src' in iframe_elem.attrs:
-                    video_url = iframe_elem['src']
+                iframe_elems = _IFRAME(tree)
+                if iframe_elems and 'src' in iframe_elems[0].attrib:
+                    video_url = iframe_elems[0].get('src')
                     
             if video_url:
                 parsed_data['video_url'] = video_url
@@ -1,81 +1,113 @@
-from typing import List, Dict, Any
-import re
+from typing import List, Dict, Any, Union
 import logging
-from bs4 import BeautifulSoup
-from app.services.parsers.content_parser import ContentParser
+from lxml import etree
+from lxml import html as lxml_html
+from app.services.parsers.content_parser import (
+    RE_DIGITS, SPANS, SUBJECT_BOTTOM, SUBJECT_TOP, TITLE_CELLS, ContentParser, element_text,
+    ensure_tree, has_class, has_clickable_rows, iter_clickable_rows, text_with_breaks
+)
 
 logger = logging.getLogger(__name__)
 
+# 목록 파싱에 사용하는 XPath (모듈 로드 시 한 번만 컴파일)
+_CELLS = etree.XPath('./td')
+
+# 상세 파싱에 사용하는 XPath
+_TEXTVIEWER = etree.XPath(f'(//td[{has_class("textviewer")}])[1]')
+_BBSVIEW_ROWS = etree.XPath(f'(//table[{has_class("bbsview")}])[1]//tr')
+_FIRST_TD = etree.XPath('(.//td)[1]')
+_FIRST_DIV = etree.XPath('(.//div)[1]')
+
 class NoticeParser(ContentParser):
     """공지사항 파싱 클래스"""
     
     def parse_list(self, html: str) -> List[Dict[str, Any]]:
-        """공지사항 목록 페이지 파싱"""
+        """
+        공지사항 목록 페이지 파싱
+        
+        Returns:
+            List[Dict[str, Any]]: 목록 페이지에 표시된 순서의 역순 (페이지 마지막 행이 첫 번째).
+                행은 스트리밍으로 문서 순서대로 읽은 뒤 한 번만 제자리에서 뒤집으며,
+                추가 복사본은 만들지 않습니다.
+        """
         try:
             if not html:
                 return []
                 
-            soup = BeautifulSoup(html, 'html.parser')
-            logger.info("공지사항 HTML 파싱 시작")
-
-            notice_rows = soup.find_all('tr', style="cursor: pointer;")
-            logger.info(f"발견된 공지사항 행 수: {len(notice_rows)}")
-
-            if not notice_rows:
+            # 대상 행이 없으면 파싱 없이 바로 종료
+            if not has_clickable_rows(html):
                 logger.warning("공지사항 목록을 찾을 수 없습니다.")
                 return []
+                
+            logger.info("공지사항 HTML 파싱 시작")
 
             notices = []
-            for row in notice_rows:
+            # 행마다 반복되는 속성 조회를 줄이기 위한 지역 바인딩
+            append = notices.append
+            extract_url = self.extract_url_from_onclick
+            extract_article_id = self.extract_article_id
+            parse_date = self.parse_date
+            digits_search = RE_DIGITS.search
+            row_count = 0
+            for row in iter_clickable_rows(html):
+                row_count += 1
                 try:
                     # onclick 속성에서 URL과 article_id 추출
-                    onclick = row.select_one('td.left').get('onclick', '')
+                    title_cells = TITLE_CELLS(row)
+                    onclick = title_cells[0].get('onclick', '') if title_cells else ''
                     article_id = None
                     detail_url = ''
 
                     if onclick:
-                        detail_url = self.extract_url_from_onclick(onclick)
-                        article_id = self.extract_article_id(detail_url)
+                        detail_url = extract_url(onclick)
+                        article_id = extract_article_id(detail_url)
 
                     if not article_id or not detail_url:
                         continue
 
-                    cols = row.find_all('td')
-                    if len(cols) >= 5:
-                        title_element = cols[2].find('div', class_='subjt_top')
-                        title = title_element.get_text(strip=True) if title_element else ''
-
-                        # 작성자 및 조회수 추출
-                        bottom_div = cols[2].find('div', class_='subjt_bottom')
-                        author = ''
-                        views = ''
-
-                        if bottom_div:
-                            spans = bottom_div.find_all('span')
-                            if spans:
-                                author = spans[0].get_text(strip=True)
-                                if len(spans) > 1:
-                                    views_text = spans[-1].get_text(strip=True)
-                                    views_match = re.search(r'\d+', views_text)
-                                    if views_match:
-                                        views = views_match.group()
-
-                        notice = {
-                            'number': cols[0].text.strip(),
-                            'article_id': article_id,
-                            'title': title,
-                            'author': author,
-                            'date': cols[4].text.strip(),
-                            'views': int(views) if views.isdigit() else 0,
-                            'url': detail_url
-                        }
-                        notices.append(notice)
+                    cols = _CELLS(row)
+                    if len(cols) < 5:
+                        continue
+                    number_td, _, title_td, _, date_td = cols[:5]
+                    title_elements = SUBJECT_TOP(title_td)
+                    title = element_text(title_elements[0]) if title_elements else ''
+
+                    # 작성자 및 조회수 추출
+                    bottom_divs = SUBJECT_BOTTOM(title_td)
+                    author = ''
+                    views = ''
+
+                    if bottom_divs:
+                        spans = SPANS(bottom_divs[0])
+                        if spans:
+                            author = element_text(spans[0])
+                            if len(spans) > 1:
+                                views_text = element_text(spans[-1])
+                                views_match = digits_search(views_text)
+                                if views_match:
+                                    views = views_match.group()
+
+                    append({
+                        'number': element_text(number_td),
+                        'article_id': article_id,
+                        'title': title,
+                        'author': author,
+                        'date': parse_date(element_text(date_td)),
+                        'views': int(views) if views.isdigit() else 0,
+                        'url': detail_url
+                    })
 
                 except Exception as e:
                     logger.error(f"공지사항 행 파싱 중 오류 발생: {e}")
                     continue
 
-            # 최신순으로 정렬
+            if not row_count:
+                logger.warning("공지사항 목록을 찾을 수 없습니다.")
+                return []
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"발견된 공지사항 행 수: {row_count}")
+
+            # 최신순으로 정렬 (행은 스트리밍으로 문서 순서대로만 읽을 수 있으므로 제자리 뒤집기)
             notices.reverse()
             return notices
 
@@ -83,40 +115,32 @@ class NoticeParser(ContentParser):
             logger.error(f"공지사항 목록 파싱 중 오류 발생: {e}")
             return []
     
-    def parse_detail(self, html: str) -> Dict[str, Any]:
-        """공지사항 상세 페이지 파싱"""
+    def parse_detail(self, html: Union[str, lxml_html.HtmlElement]) -> Dict[str, Any]:
+        """공지사항 상세 페이지 파싱 (HTML 문자열 또는 이미 파싱된 lxml 트리)"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            tree = ensure_tree(html)
+            if tree is None:
+                return {}
             detail = {}
             
             # 텍스트뷰어 찾기
-            textviewer = soup.find('td', class_='textviewer')
-            if not textviewer:
+            textviewers = _TEXTVIEWER(tree)
+            if not textviewers:
                 # 다른 방법으로 내용 찾기
-                table = soup.find('table', class_='bbsview')
-                if table:
-                    rows = table.find_all('tr')
-                    if rows and len(rows) > 0:
-                        textviewer = rows[-1].find('td')
-
-            if textviewer:
-                # 내용 추출
-                content_div = textviewer.find('div')
-                if content_div:
-                    # HTML 태그 처리
-                    for br in content_div.find_all('br'):
-                        br.replace_with('\n')
-                    for p in content_div.find_all('p'):
-                        p.insert_after(soup.new_string('\n'))
-                    detail['content'] = content_div.get_text(strip=True)
-                    detail['content_html'] = str(content_div)
-                else:
-                    # div가 없는 경우 직접 텍스트 추출
-                    detail['content'] = textviewer.get_text(strip=True)
-                    detail['content_html'] = str(textviewer)
+                rows = _BBSVIEW_ROWS(tree)
+                if rows:
+                    textviewers = _FIRST_TD(rows[-1])
+
+            if textviewers:
+                textviewer = textviewers[0]
+                # 내용 추출 (div가 없는 경우 텍스트뷰어에서 직접 추출)
+                content_divs = _FIRST_DIV(textviewer)
+                content_elem = content_divs[0] if content_divs else textviewer
+                detail['content'] = text_with_breaks(content_elem)
+                detail['content_html'] = lxml_html.tostring(content_elem, encoding='unicode', with_tail=False)
 
             # 기본 첨부파일 추출 (페이지에 있는 경우)
-            attachments = self.parse_attac88thments(html)
+            attachments = self.parse_attachments(tree)
             if attachments:
                 detail['attachments'] = attachments
 
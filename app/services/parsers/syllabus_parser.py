@@ -1,10 +1,31 @@
 from typing import List, Dict, Any
 import re
 import logging
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from app.services.parsers.content_parser import RE_WHITESPACE, cache_by_html, element_text, parse_html
 
 logger = logging.getLogger(__name__)
 
+# 섹션 제목의 [대괄호] 표기 -> 결과 키
+_SYLLABUS_KEYS = {
+    '[수업기본정보]': '수업기본정보',
+    '[담당교수정보]': '담당교수정보',
+    '[강의계획]': '강의계획',
+    '[주별강의계획]': '주별강의계획',
+}
+_RE_SECTION_MARKER = re.compile('|'.join(re.escape(marker) for marker in _SYLLABUS_KEYS))
+
+# 섹션/테이블 탐색에 사용하는 XPath (모듈 로드 시 한 번만 컴파일)
+_SECTION_TITLES = etree.XPath(
+    '//div[contains(@style, "padding-top") and contains(@style, "font-weight: bold")]'
+)
+_NEXT_TABLE = etree.XPath('following::table[1]')
+_ROWS = etree.XPath('.//tr')
+_HEADER_OR_DATA_CELLS = etree.XPath('.//*[self::th or self::td]')
+_DATA_CELLS = etree.XPath('.//td')
+
+
 class SyllabusParser:
     """강의계획서 파싱 클래스"""
     
@@ -13,18 +34,19 @@ class SyllabusParser:
         if not text:
             return ""
         # 공백 문자 정리
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = RE_WHITESPACE.sub(' ', text.strip())
         # HTML 엔티티 변환
         text = text.replace('&nbsp;', ' ').replace('&lt;', '<').replace('&gt;', '>')
         return text
     
+    @cache_by_html()
     def parse_syllabus(self, html: str) -> Dict[str, Any]:
         """강의계획서 파싱"""
         try:
             if not html:
                 return {}
                 
-            soup = BeautifulSoup(html, 'html.parser')
+            tree = parse_html(html)
             
             # 강의 기본 정보 추출
             syllabus_info = {
@@ -35,26 +57,19 @@ class SyllabusParser:
             }
             
             # 섹션 제목 찾기
-            sections = soup.find_all('div',
-                                    style=lambda value: value and 'padding-top' in value and 'font-weight: bold' in value)
+            sections = _SECTION_TITLES(tree)
             
             for section in sections:
-                section_title = section.text.strip()
-                section_key = None
+                section_title = element_text(section)
                 
                 # 섹션 제목 맵핑
-                if '[수업기본정보]' in section_title:
-                    section_key = '수업기본정보'
-                elif '[담당교수정보]' in section_title:
-                    section_key = '담당교수정보'
-                elif '[강의계획]' in section_title:
-                    section_key = '강의계획'
-                elif '[주별강의계획]' in section_title:
-                    section_key = '주별강의계획'
+                marker = _RE_SECTION_MARKER.search(section_title)
+                section_key = _SYLLABUS_KEYS.get(marker.group(0)) if marker else None
                 
                 if section_key and section_key in syllabus_info:
-                    table = section.find_next('table')
-                    if table:
+                    tables = _NEXT_TABLE(section)
+                    if tables:
+                        table = tables[0]
                         if section_key != '주별강의계획':
                             self._extract_table_info(table, syllabus_info[section_key])
                         else:
@@ -66,27 +81,27 @@ class SyllabusParser:
             logger.error(f"강의계획서 파싱 중 오류 발생: {e}")
             return {}
     
-    def _extract_table_info(self, table: BeautifulSoup, info_dict: Dict[str, str]) -> None:
+    def _extract_table_info(self, table: lxml_html.HtmlElement, info_dict: Dict[str, str]) -> None:
         """테이블 정보 추출"""
-        rows = table.find_all('tr')
+        rows = _ROWS(table)
         for row in rows:
-            cells = row.find_all(['th', 'td'])
+            cells = _HEADER_OR_DATA_CELLS(row)
             if len(cells) >= 2:
-                key = cells[0].text.strip()
-                value = cells[1].text.strip()
+                key = element_text(cells[0])
+                value = element_text(cells[1])
                 info_dict[key] = value
     
-    def _extract_weekly_syllabus(self, table: BeautifulSoup, weekly_syllabus: List[Dict[str, str]]) -> None:
+    def _extract_weekly_syllabus(self, table: lxml_html.HtmlElement, weekly_syllabus: List[Dict[str, str]]) -> None:
         """주별 강의계획 추출"""
-        rows = table.find_all('tr')[1:]  # 헤더 제외
+        rows = _ROWS(table)[1:]  # 헤더 제외
         seen_weeks = set()  # 이미 처리한 주차 추적
         
         for row in rows:
-            cols = row.find_all('td')
+            cols = _DATA_CELLS(row)
             if len(cols) >= 3:
-                week = cols[0].text.strip()
-                content = cols[1].text.strip()
-                note = cols[2].text.strip()
+                week = element_text(cols[0])
+                content = element_text(cols[1])
+                note = element_text(cols[2])
                 
                 # 빈 행이거나 이미 처리한 주차라면 건너뜀
                 if not (week and content) or week in seen_weeks:
@@ -5,6 +5,7 @@ from typing import Dict, Optional, Any, List, Sequence
 from datetime import datetime, timedelta, timezone
 from jose import jwt, JWTError
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.services.base_service import BaseService
 from app.db.repositories.session_repository import SessionRepository
@@ -28,6 +29,7 @@ class AuthSessionService(BaseService):
     def __init__(self, db_session: AsyncSession = None):
         if not self._initialized:
             self.auth_sessions: Dict[str, Dict[str, Any]] = {}  # token -> session_info
+            self._verified_tokens = TTLCache(ttl=settings.AUTH_TOKEN_CACHE_TTL)  # token -> user_info
             self._lock_ready = False
             self._db = db_session
             self._session_repo = None
@@ -169,12 +171,14 @@ class AuthSessionService(BaseService):
 
         lock = await self._ensure_lock()
         async with lock:
-            session_info = self.auth_sessions.get(token)
-
             # 메모리에서 세션 제거
-            if token in self.auth_sessions:
-                del self.auth_sessions[token]
+            session_info = self.auth_sessions.pop(token, None)
+
+            # 세션을 제거한 뒤 검증 캐시도 제거 (verify_token은 같은 락 안에서만 캐싱하므로
+            # 여기서 지운 토큰이 다시 캐싱되지 않음)
+            self._verified_tokens.pop(token)
 
+            if session_info is not None:
                 # DB에서도 세션 비활성화
                 if self._session_repo and session_info:
                     try:
@@ -200,7 +204,16 @@ class AuthSessionService(BaseService):
             return False
 
     async def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
-        """토큰 검증 및 사용자 정보 반환"""
+        """
+        토큰 검증 및 사용자 정보 반환
+
+        검증에 성공한 토큰은 AUTH_TOKEN_CACHE_TTL초 동안 캐싱되며 (토큰 만료 시각을
+        넘기지 않음), 로그아웃(end_session) 시 즉시 제거된다.
+        """
+        cached_user = self._verified_tokens.get(token)
+        if cached_user is not None:
+            return dict(cached_user)
+
         try:
             logger.info(f"토큰 검증 시작: 토큰 길이 {len(token)}자")
 
@@ -272,12 +285,20 @@ class AuthSessionService(BaseService):
                     logger.warning("세션이 비활성화됨")
                     return None
 
+                user_info = {
+                    "id": user_id,
+                    "email": session_info.get("email", "unknown@example.com"),
+                    "session_id": session_id
+                }
+
+                # 락 안에서 세션이 아직 남아 있을 때만 캐싱 (end_session과 엇갈려 로그아웃된
+                # 토큰이 캐시에 남지 않도록 함)
+                if self.auth_sessions.get(token) is session_info:
+                    remaining = (expiration_time - current_time).total_seconds()
+                    self._verified_tokens.set(token, user_info, ttl=min(settings.AUTH_TOKEN_CACHE_TTL, remaining))
+
             logger.info(f"토큰 검증 성공: user_id={user_id}")
-            return {
-                "id": user_id,
-                "email": session_info.get("email", "unknown@example.com"),
-                "session_id": session_id
-            }
+            return dict(user_info)
 
         except JWTError as e:
             logger.error(f"JWT 디코딩 에러: {str(e)}")
@@ -3,8 +3,48 @@ import logging
 import json
 from typing import Dict, List, Optional, Any
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+
+class _SharedTransport(httpx.AsyncHTTPTransport):
+    """모든 EclassSession이 공유하는 커넥션 풀 (개별 클라이언트 종료 시에는 닫지 않음)"""
+
+    async def aclose(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        await super().aclose()
+
+
+_shared_transport: Optional[_SharedTransport] = None
+
+
+def get_shared_transport() -> _SharedTransport:
+    """
+    e-Class 요청용 공유 커넥션 풀 제공
+
+    쿠키는 세션(클라이언트)마다 따로 관리되므로, 사용자별 로그인 상태를 유지하면서
+    TCP/TLS 연결과 HTTP/2 다중화는 모든 사용자가 함께 사용한다.
+    """
+    global _shared_transport
+    if _shared_transport is None:
+        _shared_transport = _SharedTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        )
+    return _shared_transport
+
+
+async def close_shared_transport() -> None:
+    """공유 커넥션 풀 종료 (애플리케이션 종료 시)"""
+    global _shared_transport
+    if _shared_transport is not None:
+        await _shared_transport.shutdown()
+        _shared_transport = None
+
+
 class EclassSession:
     """e-Class 웹 사이트와의 HTTP 통신 관리"""
     
@@ -17,14 +57,14 @@ class EclassSession:
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
         }
-        self.client = httpx.AsyncClient(headers=self.headers, follow_redirects=True, timeout=30.0)
         self.user_id = None
         self.cookies = httpx.Cookies()
         self.client = httpx.AsyncClient(
             headers=self.headers,
             cookies=self.cookies,
             follow_redirects=True,
-            timeout=30.0
+            timeout=settings.REQUEST_TIMEOUT,
+            transport=get_shared_transport()
         )
         self._is_logged_in = False
 
@@ -108,10 +148,14 @@ class EclassSession:
     async def get(self, url: str, params: Dict = None) -> httpx.Response:
         """GET 요청 수행"""
         try:
-            logger.debug(f"GET 요청: {url}, 파라미터: {params}")
+            # 디버그 로그가 꺼져 있으면 메시지 포맷과 응답 본문 디코딩(len(response.text))을 생략
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(f"GET 요청: {url}, 파라미터: {params}")
             response = await self.client.get(url, params=params)
             response.raise_for_status()
-            logger.debug(f"GET 응답: {response.status_code}, 내용 길이: {len(response.text)}")
+            if debug:
+                logger.debug(f"GET 응답: {response.status_code}, 내용 길이: {len(response.text)}")
             return response
         except httpx.HTTPError as e:
             logger.error(f"GET 요청 중 HTTP 오류 발생: {url}, {e}")
@@ -123,10 +167,13 @@ class EclassSession:
     async def post(self, url: str, data: Dict = None) -> httpx.Response:
         """POST 요청 수행"""
         try:
-            logger.debug(f"POST 요청: {url}, 데이터: {data}")
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(f"POST 요청: {url}, 데이터: {data}")
             response = await self.client.post(url, data=data)
             response.raise_for_status()
-            logger.debug(f"POST 응답: {response.status_code}, 내용 길이: {len(response.text)}")
+            if debug:
+                logger.debug(f"POST 응답: {response.status_code}, 내용 길이: {len(response.content)}")
             return response
         except httpx.HTTPError as e:
             logger.error(f"POST 요청 중 HTTP 오류 발생: {url}, {e}")
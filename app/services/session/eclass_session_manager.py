@@ -1,9 +1,11 @@
 import logging
 import asyncio
+import time
 from typing import Dict, Optional
 
+from app.core.config import settings
 from app.services.base_service import BaseService
-from app.services.session.eclass_session import EclassSession
+from app.services.session.eclass_session import EclassSession, close_shared_transport
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,7 @@ class EclassSessionManager(BaseService):
     def __init__(self):
         if not self._initialized:
             self.eclass_sessions: Dict[str, EclassSession] = {}  # user_id -> EclassSession
+            self._checked_until: Dict[str, float] = {}  # user_id -> 로그인 상태 확인 만료 시각
             self._lock_ready = False
             self._initialized = True
             logger.info("EclassSessionManager 초기화 완료")
@@ -46,12 +49,17 @@ class EclassSessionManager(BaseService):
         """서비스 종료 및 리소스 정리"""
         logger.info("EclassSessionManager 종료 시작")
         await self.close_all_sessions()
+        await close_shared_transport()
         logger.info("EclassSessionManager 종료 완료")
 
     async def get_session(self, user_id: str) -> Optional[EclassSession]:
         """
         사용자를 위한 이클래스 세션 가져오기
 
+        최근 ECLASS_SESSION_CHECK_TTL초 이내에 로그인 상태가 확인된 세션은
+        추가 요청 없이 바로 반환하며, 동시에 들어온 요청은 lock으로 묶여
+        한 번만 로그인한다.
+
         Args:
             user_id: 사용자 ID
 
@@ -63,13 +71,18 @@ class EclassSessionManager(BaseService):
             # 기존 세션 확인
             if user_id in self.eclass_sessions:
                 session = self.eclass_sessions[user_id]
+                if time.monotonic() < self._checked_until.get(user_id, 0.0):
+                    return session
+
                 is_logged_in = await session.is_logged_in()
 
                 if is_logged_in:
                     logger.debug(f"사용자 {user_id}의 기존 세션 재사용")
+                    self._mark_checked(user_id)
                     return session
                 else:
                     logger.debug(f"사용자 {user_id}의 세션이 만료됨, 새로운 세션 생성")
+                    self._checked_until.pop(user_id, None)
 
             # 사용자의 이클래스 계정 정보 조회
             eclass_credentials = await self._get_user_eclass_credentials(user_id)
@@ -91,11 +104,16 @@ class EclassSessionManager(BaseService):
                 # 세션 객체에 이클래스 ID 저장 (URL 생성 시 사용)
                 eclass_session.eclass_id = eclass_credentials["username"]
                 self.eclass_sessions[user_id] = eclass_session
+                self._mark_checked(user_id)
                 return eclass_session
             else:
                 logger.error(f"사용자 {user_id} 로그인 실패")
                 return None
 
+    def _mark_checked(self, user_id: str) -> None:
+        """로그인 상태 확인 시각 기록"""
+        self._checked_until[user_id] = time.monotonic() + settings.ECLASS_SESSION_CHECK_TTL
+
     async def _get_user_eclass_credentials(self, user_id: str) -> Optional[Dict[str, str]]:
         """
         사용자의 이클래스 계정 정보 조회
@@ -144,6 +162,7 @@ class EclassSessionManager(BaseService):
                 session = self.eclass_sessions[user_id]
                 await session.close()
                 del self.eclass_sessions[user_id]
+            self._checked_until.pop(user_id, None)
 
     async def check_sessions_health(self) -> None:
         """모든 세션의 건강 상태 확인 (주기적 호출)"""
@@ -181,6 +200,7 @@ class EclassSessionManager(BaseService):
                     logger.error(f"사용자 {user_id}의 세션 종료 중 오류: {str(e)}")
 
             self.eclass_sessions.clear()
+            self._checked_until.clear()
             logger.info("모든 세션 종료 완료")
 
     async def is_valid(self) -> bool:
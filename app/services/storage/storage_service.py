@@ -28,8 +28,8 @@ class StorageService(BaseService):
         
         if settings.SUPABASE_URL and settings.SUPABASE_KEY:
             try:
-                from supabase import create_client
-                self.supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+                from app.core.supabase_client import get_supabase_client
+                self.supabase = get_supabase_client()
                 logger.info("Supabase 스토리지 클라이언트 초기화 완료")
             except Exception as e:
                 logger.error(f"Supabase 클라이언트 초기화 중 오류 발생: {str(e)}")
@@ -6,6 +6,8 @@ import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.db.base import AsyncSessionLocal
 from app.services.base_service import BaseService
 from app.services.session.eclass_session_manager import EclassSessionManager
 from app.services.content.course_service import CourseService
@@ -334,7 +336,7 @@ class CrawlService(BaseService):
 
         # 작업 시작
         task = asyncio.create_task(
-            self._crawl_all_courses_task(user_id, courses, db_session, auto_download, task_id)
+            self._crawl_all_courses_task(user_id, courses, auto_download, task_id)
         )
 
         # 작업 관리
@@ -354,15 +356,17 @@ class CrawlService(BaseService):
             "courses": [course.name for course in courses]
         }
 
-    async def _crawl_all_courses_task(self, user_id: str, courses: List[Any], db_session: AsyncSession,
+    async def _crawl_all_courses_task(self, user_id: str, courses: List[Any],
                                       auto_download: bool, task_id: str) -> Dict[str, Any]:
         """
         모든 강의 크롤링 작업 수행
 
+        강의들은 최대 MAX_CONCURRENT_TASKS개까지 동시에 크롤링되며, AsyncSession은
+        동시에 사용할 수 없으므로 강의마다 별도의 데이터베이스 세션을 연다.
+
         Args:
             user_id: 사용자 ID
             courses: 강의 목록
-            db_session: 데이터베이스 세션
             auto_download: 첨부파일 자동 다운로드 여부
             task_id: 작업 ID
 
@@ -392,46 +396,55 @@ class CrawlService(BaseService):
                 }
             }
 
-            # 각 강의 순차적으로 크롤링
-            for course in courses:
-                try:
-                    course_id = course.id
+            # 각 강의 동시 크롤링 (이클래스 서버 부하를 고려해 동시 실행 수 제한)
+            semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_TASKS)
 
-                    # 개별 강의 크롤링
-                    course_result = await self.crawl_course(
-                        user_id, course_id, db_session, auto_download, f"{task_id}_{course_id}"
-                    )
+            async def crawl_one(course) -> Dict[str, Any]:
+                async with semaphore:
+                    async with AsyncSessionLocal() as course_db:
+                        return await self._crawl_course_task(
+                            user_id, course.id, course_db, auto_download, f"{task_id}_{course.id}"
+                        )
 
-                    # 결과 저장
-                    result["course_results"][course_id] = {
-                        "name": course.name,
-                        "code": course.code,
-                        "status": course_result.get("status", "unknown"),
-                        "details": course_result.get("details", {})
-                    }
-
-                    # 요약 정보 업데이트
-                    if course_result.get("status") == "success":
-                        result["summary"]["completed"] += 1
-                        details = course_result.get("details", {})
+            course_results = await asyncio.gather(
+                *(crawl_one(course) for course in courses),
+                return_exceptions=True
+            )
 
-                        for category in ["notices", "materials", "assignments", "syllabus"]:
-                            if category in details:
-                                for key in ["count", "new", "errors"]:
-                                    if key in details[category]:
-                                        result["summary"][category][key] += details[category][key]
-                    else:
-                        result["summary"]["failed"] += 1
+            for course, course_result in zip(courses, course_results):
+                course_id = course.id
 
-                except Exception as e:
-                    logger.error(f"강의 {course_id} 크롤링 중 오류: {e}")
+                if isinstance(course_result, Exception):
+                    logger.error(f"강의 {course_id} 크롤링 중 오류: {course_result}")
                     result["course_results"][course_id] = {
                         "name": course.name,
                         "code": course.code,
                         "status": "error",
-                        "message": str(e)
+                        "message": str(course_result)
                     }
                     result["summary"]["failed"] += 1
+                    continue
+
+                # 결과 저장
+                result["course_results"][course_id] = {
+                    "name": course.name,
+                    "code": course.code,
+                    "status": course_result.get("status", "unknown"),
+                    "details": course_result.get("details", {})
+                }
+
+                # 요약 정보 업데이트
+                if course_result.get("status") == "success":
+                    result["summary"]["completed"] += 1
+                    details = course_result.get("details", {})
+
+                    for category in ["notices", "materials", "assignments", "syllabus"]:
+                        if category in details:
+                            for key in ["count", "new", "errors"]:
+                                if key in details[category]:
+                                    result["summary"][category][key] += details[category][key]
+                else:
+                    result["summary"]["failed"] += 1
 
             # 작업 완료
             if task_id in self.active_tasks:
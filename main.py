@@ -1,6 +1,7 @@
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import logging
 import sys
 
@@ -27,7 +28,8 @@ def create_app() -> FastAPI:
         title="AutoLMS",
         description="서울과학기술대학교 e-Class 자동화 시스템",
         version="1.0.0",
-        openapi_url=f"{settings.API_V1_STR}/openapi.json"
+        openapi_url=f"{settings.API_V1_STR}/openapi.json",
+        default_response_class=ORJSONResponse
     )
 
     # CORS 설정